@@ -1,16 +1,44 @@
 # imports
 import os
+import sys
+import asyncio
+import aiohttp
 import requests
 import json
-import time
+import re
+import hashlib
+import diskcache
 from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 from IPython.display import Markdown, display
 from openai import OpenAI
 from urllib.parse import urljoin, urlparse
+from urllib3.util.retry import Retry
 import logging
 
+# Token-accurate prompt truncation; falls back to characters without it
+try:
+    import tiktoken
+    _ENCODER = tiktoken.get_encoding('cl100k_base')
+except ImportError:
+    _ENCODER = None
+
+# Faster JSON codec for LLM output and cache keys; stdlib json works too
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_loads(data):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def _json_dumps_key(payload) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(payload, sort_keys=True).encode()
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -27,6 +55,111 @@ else:
 MODEL = 'llama3.2'
 openai = OpenAI(base_url='http://localhost:11434/v1', api_key='ollama')
 
+# On-disk cache for LLM responses - retrying the same URL skips inference
+LLM_CACHE = diskcache.Cache('.llm_cache')
+LLM_CACHE_TTL = 86400  # one day
+
+# Semantic cache over create_brochure: near-identical landing pages
+# (e.g. openai.com vs www.openai.com) reuse an earlier brochure even
+# when the exact-key cache misses. Optional - disabled when the
+# embedding stack isn't installed.
+try:
+    import numpy as np
+    import faiss
+    from sentence_transformers import SentenceTransformer
+    SEMANTIC_CACHE_AVAILABLE = True
+except ImportError:
+    SEMANTIC_CACHE_AVAILABLE = False
+
+SEMANTIC_THRESHOLD = 0.92  # minimum cosine similarity for a cache hit
+_EMBED_DIM = 384  # all-MiniLM-L6-v2 output size
+
+_embedder = None
+_semantic_index = None
+
+def _load_semantic_cache() -> bool:
+    """Lazily load the embedding model and rebuild the FAISS index from disk"""
+    global _embedder, _semantic_index
+    if not SEMANTIC_CACHE_AVAILABLE:
+        return False
+    if _embedder is None:
+        _embedder = SentenceTransformer('all-MiniLM-L6-v2')
+        _semantic_index = faiss.IndexFlatIP(_EMBED_DIM)
+        vectors = LLM_CACHE.get('semantic/vectors', [])
+        if vectors:
+            _semantic_index.add(np.asarray(vectors, dtype='float32'))
+    return True
+
+def _embed_details(details: str):
+    """Embed the start of the scraped details as a normalized vector"""
+    vec = _embedder.encode([details[:2048]], normalize_embeddings=True)
+    return np.asarray(vec, dtype='float32')
+
+def semantic_lookup(details: str):
+    """Return (cached brochure or None, embedding vector or None)"""
+    if not _load_semantic_cache():
+        return None, None
+    vec = _embed_details(details)
+    if _semantic_index.ntotal > 0:
+        scores, ids = _semantic_index.search(vec, 1)
+        if scores[0][0] >= SEMANTIC_THRESHOLD:
+            brochures = LLM_CACHE.get('semantic/brochures', [])
+            if 0 <= ids[0][0] < len(brochures):
+                logger.info(f"Semantic cache hit (similarity {scores[0][0]:.3f})")
+                return brochures[ids[0][0]], vec
+    return None, vec
+
+def semantic_store(vec, brochure: str) -> None:
+    """Add a freshly generated brochure to the semantic cache"""
+    if vec is None:
+        return
+    _semantic_index.add(vec)
+    vectors = LLM_CACHE.get('semantic/vectors', [])
+    brochures = LLM_CACHE.get('semantic/brochures', [])
+    vectors.append(vec[0].tolist())
+    brochures.append(brochure)
+    LLM_CACHE['semantic/vectors'] = vectors
+    LLM_CACHE['semantic/brochures'] = brochures
+
+def _chat_cache_key(messages: List[Dict], **kwargs) -> str:
+    key_material = _json_dumps_key({'model': MODEL, 'messages': messages, **kwargs})
+    return hashlib.sha256(key_material).hexdigest()
+
+def cached_chat(messages: List[Dict], **kwargs) -> str:
+    """Run a chat completion, serving repeated prompts from the on-disk cache"""
+    key = _chat_cache_key(messages, **kwargs)
+    if key in LLM_CACHE:
+        logger.info("LLM cache hit")
+        return LLM_CACHE[key]
+
+    response = openai.chat.completions.create(model=MODEL, messages=messages, **kwargs)
+    result = response.choices[0].message.content
+    LLM_CACHE.set(key, result, expire=LLM_CACHE_TTL)
+    return result
+
+def cached_chat_stream(messages: List[Dict], **kwargs) -> str:
+    """Like cached_chat, but prints tokens as they are generated on a miss"""
+    key = _chat_cache_key(messages, **kwargs)
+    if key in LLM_CACHE:
+        logger.info("LLM cache hit")
+        result = LLM_CACHE[key]
+        print(result)
+        return result
+
+    stream = openai.chat.completions.create(model=MODEL, messages=messages,
+                                            stream=True, **kwargs)
+    pieces = []
+    for chunk in stream:
+        piece = chunk.choices[0].delta.content or ''
+        sys.stdout.write(piece)
+        sys.stdout.flush()
+        pieces.append(piece)
+    sys.stdout.write('\n')
+
+    result = ''.join(pieces)
+    LLM_CACHE.set(key, result, expire=LLM_CACHE_TTL)
+    return result
+
 # Enhanced headers with more realistic user agent
 headers = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -37,72 +170,143 @@ headers = {
     "Upgrade-Insecure-Requests": "1",
 }
 
+# Shared timeout for all page fetches
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+# Shared pool for HTML parsing so CPU work overlaps in-flight fetches
+_PARSE_POOL = ThreadPoolExecutor(max_workers=8)
+
+# Cap on downloaded page size - the prompt is truncated far below this
+# anyway, so multi-megabyte pages are never worth downloading or parsing
+MAX_BODY_BYTES = 512 * 1024
+
+# Pooled session for the synchronous probes in get_user_input, with
+# keep-alive connections and automatic retries on transient errors
+SESSION = requests.Session()
+SESSION.headers.update(headers)
+_adapter = requests.adapters.HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.5,
+                      status_forcelist=[429, 500, 502, 503, 504]),
+)
+SESSION.mount('https://', _adapter)
+SESSION.mount('http://', _adapter)
+
+# Elements stripped from the body before text extraction
+_IRRELEVANT_SELECTOR = "script,style,img,input,nav,footer,header"
+
+# Whitespace cleanup for extracted text, compiled once - run per page.
+# Collapses each newline plus surrounding blank space into one newline.
+_CLEAN = re.compile(r'[ \t]*\n[ \t\n]*')
+
+# Links that are never brochure material - boilerplate pages and binary assets
+_JUNK_LINK_RE = re.compile(
+    r'/(privacy|terms|login|signin|cart|cdn-cgi|feed|rss)|\.(pdf|jpg|png|zip)$',
+    re.I,
+)
+
+def _normalize_link(url: str) -> str:
+    """Strip fragment, query string and trailing slash from a URL"""
+    parsed = urlparse(url)
+    return parsed._replace(fragment='', query='').geturl().rstrip('/')
+
 class Website:
     """
     A utility class to represent a Website that we have scraped, with improved error handling
     """
 
-    def __init__(self, url: str, timeout: int = 10, max_retries: int = 3):
+    __slots__ = ('url', 'title', 'text', 'links', 'success')
+
+    def __init__(self, url: str):
         self.url = url
         self.title = "No title found"
         self.text = ""
         self.links = []
         self.success = False
-        
-        for attempt in range(max_retries):
-            try:
-                logger.info(f"Attempting to fetch {url} (attempt {attempt + 1}/{max_retries})")
-                response = requests.get(
-                    url, 
-                    headers=headers, 
-                    timeout=timeout,
-                    allow_redirects=True
-                )
-                response.raise_for_status()
-                
-                self.body = response.content
-                soup = BeautifulSoup(self.body, 'html.parser')
-                
-                # Extract title
-                if soup.title:
-                    self.title = soup.title.string.strip()
-                
-                # Extract text content
-                if soup.body:
-                    # Remove irrelevant elements
-                    for irrelevant in soup.body(["script", "style", "img", "input", "nav", "footer", "header"]):
-                        irrelevant.decompose()
-                    self.text = soup.body.get_text(separator="\n", strip=True)
-                    # Clean up excessive whitespace
-                    self.text = '\n'.join(line.strip() for line in self.text.split('\n') if line.strip())
-                
-                # Extract and normalize links
-                links = []
-                for link in soup.find_all('a', href=True):
-                    href = link.get('href')
-                    if href:
-                        # Convert relative URLs to absolute URLs
-                        absolute_url = urljoin(url, href)
-                        # Only include HTTP/HTTPS links
-                        if absolute_url.startswith(('http://', 'https://')):
-                            links.append(absolute_url)
-                
-                self.links = list(set(links))  # Remove duplicates
-                self.success = True
-                logger.info(f"Successfully fetched {url}")
-                break
-                
-            except requests.exceptions.RequestException as e:
-                logger.warning(f"Attempt {attempt + 1} failed for {url}: {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
-                else:
-                    logger.error(f"Failed to fetch {url} after {max_retries} attempts")
-                    self.text = f"Failed to fetch content from {url}: {str(e)}"
+
+    def _parse(self, body: bytes) -> None:
+        """Parse a fetched HTML body and populate title, text and links"""
+        tree = LexborHTMLParser(body)
+
+        # Extract title
+        title = tree.css_first('title')
+        if title:
+            self.title = title.text(strip=True)
+
+        # Extract text content
+        if tree.body:
+            # Remove irrelevant elements
+            for irrelevant in tree.css(_IRRELEVANT_SELECTOR):
+                irrelevant.decompose()
+            raw_text = tree.body.text(separator="\n", strip=True)
+            # Clean up excessive whitespace in a single C-level regex pass
+            self.text = _CLEAN.sub('\n', raw_text.strip())
+
+        # Extract and normalize links
+        links = []
+        for anchor in tree.css('a[href]'):
+            href = anchor.attributes.get('href')
+            if not href:
+                continue
+            # Convert relative URLs to absolute URLs
+            absolute_url = urljoin(self.url, href)
+            # Only include HTTP/HTTPS links, minus obvious junk
+            if not absolute_url.startswith(('http://', 'https://')):
+                continue
+            if _JUNK_LINK_RE.search(urlparse(absolute_url).path):
+                continue
+            links.append(_normalize_link(absolute_url))
+
+        # Deduplicate preserving order, with same-domain links first
+        own_domain = urlparse(self.url).netloc
+        self.links = sorted(dict.fromkeys(links),
+                            key=lambda link: urlparse(link).netloc != own_domain)
+        self.success = True
 
     def get_contents(self) -> str:
         return f"Webpage Title:\n{self.title}\nWebpage Contents:\n{self.text}\n\n"
 
+async def fetch(session: aiohttp.ClientSession, url: str, max_retries: int = 3) -> Optional[bytes]:
+    """Fetch a URL with retries: the raw body, b'' for non-HTML, None on failure"""
+    for attempt in range(max_retries):
+        try:
+            logger.info(f"Attempting to fetch {url} (attempt {attempt + 1}/{max_retries})")
+            async with session.get(url, allow_redirects=True) as response:
+                response.raise_for_status()
+                # Don't download or parse PDFs, images and other binaries
+                ctype = response.headers.get('Content-Type', '').lower()
+                if 'html' not in ctype:
+                    logger.info(f"Skipping non-HTML content at {url} ({ctype or 'no content type'})")
+                    return b''
+                # Stream at most MAX_BODY_BYTES instead of reading the
+                # whole body; the connection closes with the context
+                body = await response.content.read(MAX_BODY_BYTES)
+            logger.info(f"Successfully fetched {url}")
+            return body
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"Attempt {attempt + 1} failed for {url}: {e}")
+            if attempt < max_retries - 1:
+                await asyncio.sleep(2 ** attempt)  # Exponential backoff
+            else:
+                logger.error(f"Failed to fetch {url} after {max_retries} attempts")
+    return None
+
+async def build_website(session: aiohttp.ClientSession, url: str,
+                        max_retries: int = 3) -> Website:
+    """Factory that fetches a URL and returns a parsed Website"""
+    website = Website(url)
+    body = await fetch(session, url, max_retries=max_retries)
+    if body is None:
+        website.text = f"Failed to fetch content from {url}"
+    elif body:
+        # Parse off the event loop; Lexbor does its work in C
+        await asyncio.get_running_loop().run_in_executor(_PARSE_POOL, website._parse, body)
+    else:
+        # Non-HTML responses fetch fine but have nothing worth parsing
+        website.success = True
+    return website
+
 # Improved link system prompt
 link_system_prompt = """You are provided with a list of links found on a webpage. 
 You are able to decide which of the links would be most relevant to include in a brochure about the company, 
@@ -126,20 +330,21 @@ def get_links_user_prompt(website: Website) -> str:
     user_prompt += "please decide which of these are relevant web links for a brochure about the company. "
     user_prompt += "Respond with the full https URL in JSON format. Select only the most important links (max 5).\n\n"
     user_prompt += "Links:\n"
-    user_prompt += "\n".join(website.links[:50])  # Limit to first 50 links to avoid token limits
+    user_prompt += "\n".join(website.links[:30])  # Limit to first 30 links to avoid token limits
     return user_prompt
 
-def get_links(url: str) -> Dict:
+async def get_links(session: aiohttp.ClientSession, url: str) -> Dict:
     """Extract relevant links from a website with error handling"""
-    website = Website(url)
-    
+    website = await get_website(session, url)
+
     if not website.success:
         logger.error(f"Failed to fetch website {url}")
         return {"links": []}
-    
+
     try:
-        response = openai.chat.completions.create(
-            model=MODEL,
+        # Run the blocking LLM call in a thread so the event loop stays free
+        result = await asyncio.to_thread(
+            cached_chat,
             messages=[
                 {"role": "system", "content": link_system_prompt},
                 {"role": "user", "content": get_links_user_prompt(website)}
@@ -147,62 +352,87 @@ def get_links(url: str) -> Dict:
             response_format={"type": "json_object"},
             temperature=0.1  # Lower temperature for more consistent JSON output
         )
-        result = response.choices[0].message.content
-        parsed_result = json.loads(result)
-        
-        # Validate that links are accessible
+        parsed_result = _json_loads(result)
+
+        # Cheap syntactic check only - the real GET in get_all_details
+        # already surfaces dead links via raise_for_status
         validated_links = []
         for link in parsed_result.get("links", []):
-            if validate_url(link.get("url", "")):
+            parsed = urlparse(link.get("url", ""))
+            if parsed.scheme in ('http', 'https') and parsed.netloc:
                 validated_links.append(link)
-        
+
         return {"links": validated_links}
-        
+
     except (json.JSONDecodeError, Exception) as e:
         logger.error(f"Error processing links for {url}: {e}")
         return {"links": []}
 
-def validate_url(url: str) -> bool:
-    """Validate if a URL is accessible"""
-    try:
-        parsed = urlparse(url)
-        if not parsed.scheme or not parsed.netloc:
-            return False
-        
-        # Quick head request to check if URL is accessible
-        response = requests.head(url, headers=headers, timeout=5, allow_redirects=True)
-        return response.status_code < 400
-    except:
-        return False
+# Paths the LLM almost always selects - prefetched while it deliberates
+_SPECULATIVE_PATHS = ('about', 'careers', 'products')
+
+# Per-run memo of in-flight and finished fetches, keyed on normalized URL.
+# Cleared at the start of each brochure run since every run has its own
+# event loop and tasks cannot cross loops.
+_WEBSITE_CACHE: Dict[str, asyncio.Task] = {}
+
+def get_website(session: aiohttp.ClientSession, url: str,
+                max_retries: int = 3) -> asyncio.Task:
+    """Memoized build_website - each normalized URL is fetched at most once per run"""
+    key = _normalize_link(url)
+    task = _WEBSITE_CACHE.get(key)
+    if task is None:
+        task = asyncio.ensure_future(build_website(session, url, max_retries=max_retries))
+        _WEBSITE_CACHE[key] = task
+    return task
 
-def get_all_details(url: str) -> str:
+async def get_all_details(url: str) -> str:
     """Get website details with improved error handling and content management"""
     result = "Landing page:\n"
-    main_website = Website(url)
-    result += main_website.get_contents()
-    
-    if not main_website.success:
-        return result
-    
-    links = get_links(url)
-    logger.info(f"Found {len(links['links'])} relevant links")
-    
-    for link in links["links"]:
-        try:
-            link_url = link["url"]
-            logger.info(f"Processing {link['type']}: {link_url}")
-            
-            link_website = Website(link_url)
+    _WEBSITE_CACHE.clear()
+
+    # One session per brochure so all fetches share the connection pool;
+    # sub-pages reuse the landing page's keep-alive connections
+    connector = aiohttp.TCPConnector(limit=32, limit_per_host=16, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(headers=headers, timeout=REQUEST_TIMEOUT,
+                                     connector=connector) as session:
+        main_website = await get_website(session, url)
+        result += main_website.get_contents()
+
+        if not main_website.success:
+            return result
+
+        # Speculatively fetch the usual brochure pages while link selection
+        # waits on the LLM; hits are ready the moment the link JSON returns,
+        # and even misses warm pooled connections to the host
+        parsed = urlparse(url)
+        base = f"{parsed.scheme}://{parsed.netloc}"
+        speculative = [get_website(session, f"{base}/{path}", max_retries=1)
+                       for path in _SPECULATIVE_PATHS]
+
+        links = await get_links(session, url)
+        logger.info(f"Found {len(links['links'])} relevant links")
+
+        # Fetch all sub-pages concurrently; the memo dedupes against the
+        # landing page and any speculative hits
+        sub_websites = await asyncio.gather(
+            *[get_website(session, link["url"]) for link in links["links"]],
+            return_exceptions=True
+        )
+
+        # Settle unused speculative fetches before the session closes
+        await asyncio.gather(*speculative, return_exceptions=True)
+
+        for link, link_website in zip(links["links"], sub_websites):
+            if isinstance(link_website, Exception):
+                logger.error(f"Error processing link {link}: {link_website}")
+                continue
             if link_website.success:
                 result += f"\n\n{link['type'].title()}:\n"
                 result += link_website.get_contents()
             else:
-                logger.warning(f"Failed to fetch {link_url}")
-                
-        except Exception as e:
-            logger.error(f"Error processing link {link}: {e}")
-            continue
-    
+                logger.warning(f"Failed to fetch {link['url']}")
+
     return result
 
 # Improved system prompt
@@ -218,40 +448,49 @@ Your brochure should be well-structured and include:
 
 Respond in clean, professional markdown format. Make the brochure engaging and informative while keeping it concise."""
 
-def get_brochure_user_prompt(company_name: str, url: str) -> str:
+# Budget for scraped details in the brochure prompt
+MAX_DETAIL_TOKENS = 6000
+MAX_DETAIL_CHARS = 15000  # fallback when tiktoken is unavailable
+
+def truncate_details(details: str) -> str:
+    """Trim scraped details to the model's context budget, by tokens when possible"""
+    if _ENCODER is not None:
+        ids = _ENCODER.encode(details)
+        if len(ids) > MAX_DETAIL_TOKENS:
+            details = _ENCODER.decode(ids[:MAX_DETAIL_TOKENS])
+            details += "\n... (content truncated for length)"
+    elif len(details) > MAX_DETAIL_CHARS:
+        details = details[:MAX_DETAIL_CHARS]
+        details += "\n... (content truncated for length)"
+    return details
+
+def get_brochure_user_prompt(company_name: str, details: str) -> str:
     """Generate user prompt with content length management"""
     user_prompt = f"You are looking at a company called: {company_name}\n"
     user_prompt += f"Here are the contents of its landing page and other relevant pages; use this information to build a comprehensive brochure of the company in markdown.\n\n"
-    
-    details = get_all_details(url)
-    
-    # Intelligent truncation - keep the most important parts
-    if len(details) > 15000:
-        lines = details.split('\n')
-        truncated_lines = []
-        char_count = 0
-        
-        for line in lines:
-            if char_count + len(line) > 15000:
-                truncated_lines.append("... (content truncated for length)")
-                break
-            truncated_lines.append(line)
-            char_count += len(line)
-        
-        details = '\n'.join(truncated_lines)
-    
-    user_prompt += details
+    user_prompt += truncate_details(details)
     return user_prompt
 
-def create_brochure(company_name: str, url: str) -> Optional[str]:
+def create_brochure(company_name: str, url: str, fresh: bool = False) -> Optional[str]:
     """Create brochure with error handling"""
     try:
         logger.info(f"Creating brochure for {company_name} at {url}")
-        
-        user_prompt = get_brochure_user_prompt(company_name, url)
-        
-        response = openai.chat.completions.create(
-            model=MODEL,
+
+        details = asyncio.run(get_all_details(url))
+
+        # Semantically similar landing pages reuse an earlier brochure
+        vec = None
+        if not fresh:
+            cached, vec = semantic_lookup(details)
+            if cached is not None:
+                print(cached)
+                return cached
+
+        user_prompt = get_brochure_user_prompt(company_name, details)
+
+        # Stream so the user sees markdown at time-to-first-token instead
+        # of waiting for the full generation
+        result = cached_chat_stream(
             messages=[
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt}
@@ -259,9 +498,9 @@ def create_brochure(company_name: str, url: str) -> Optional[str]:
             temperature=0.7,
             max_tokens=2000
         )
-        
-        result = response.choices[0].message.content
-        display(Markdown(result))
+
+        if not fresh:
+            semantic_store(vec, result)
         return result
         
     except Exception as e:
@@ -300,7 +539,7 @@ def get_user_input():
         # Test if URL is accessible
         try:
             print(f"🔍 Testing connection to {url}...")
-            response = requests.head(url, headers=headers, timeout=10, allow_redirects=True)
+            response = SESSION.head(url, timeout=10, allow_redirects=True)
             if response.status_code >= 400:
                 print(f"⚠️  Website returned status code {response.status_code}")
                 retry = input("Continue anyway? (y/n): ").lower()
@@ -334,19 +573,19 @@ def get_user_input():
             
     return url, company_name
 
-def main():
+def main(fresh: bool = False):
     """Main function to run the brochure generator"""
     try:
         url, company_name = get_user_input()
-        
+
         if not url or not company_name:
             print("👋 Goodbye!")
             return
-            
+
         print(f"\n🚀 Generating brochure for {company_name}...")
         print("This may take a few moments...")
-        
-        result = create_brochure(company_name, url)
+
+        result = create_brochure(company_name, url, fresh=fresh)
         
         if result:
             print(f"\n✅ Brochure generated successfully!")
@@ -370,12 +609,12 @@ def main():
         print(f"\n❌ An unexpected error occurred: {e}")
         logger.error(f"Unexpected error in main: {e}")
 
-def interactive_mode():
+def interactive_mode(fresh: bool = False):
     """Interactive mode allowing multiple brochure generations"""
     print("🎯 Interactive Mode - Generate multiple brochures")
-    
+
     while True:
-        main()
+        main(fresh=fresh)
         
         print("\n" + "=" * 60)
         another = input("Generate another brochure? (y/n): ").lower()
@@ -387,12 +626,12 @@ def interactive_mode():
 # Example usage with user input
 if __name__ == "__main__":
     try:
-        # Check if running interactively
-        import sys
-        if len(sys.argv) > 1 and sys.argv[1] == '--interactive':
-            interactive_mode()
+        # Check if running interactively; --fresh bypasses the semantic cache
+        fresh = '--fresh' in sys.argv[1:]
+        if '--interactive' in sys.argv[1:]:
+            interactive_mode(fresh=fresh)
         else:
-            main()
+            main(fresh=fresh)
     except Exception as e:
         print(f"Error in main execution: {e}")
         logger.error(f"Fatal error: {e}")